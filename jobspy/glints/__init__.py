@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-import math
+import hashlib
 import random
+import re
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Iterable
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 from jobspy.model import JobPost, JobResponse, Location, Scraper, ScraperInput, Site
 from jobspy.util import create_logger, create_session
@@ -17,6 +29,67 @@ from jobspy.util import create_logger, create_session
 log = create_logger("Glints")
 
 
+@dataclass
+class _ItemsSoA:
+    """Parsed job rows staged column-wise until they become JobPost models."""
+
+    titles: list[str] = field(default_factory=list)
+    urls: list[str] = field(default_factory=list)
+    companies: list[str | None] = field(default_factory=list)
+    locations: list[str | None] = field(default_factory=list)
+    ids: list[Any] = field(default_factory=list)
+    posted_ats: list[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def append(
+        self,
+        title: str,
+        url: str,
+        company: str | None,
+        location: str | None,
+        job_id: Any,
+        posted_at: Any,
+    ) -> None:
+        self.titles.append(title)
+        self.urls.append(url)
+        self.companies.append(company)
+        self.locations.append(location)
+        self.ids.append(job_id)
+        self.posted_ats.append(posted_at)
+
+
+# Known locations of the jobs array under props.pageProps, tried in order
+# before falling back to a full walk of the payload.
+_JOBS_ARRAY_PATHS = (
+    ("initialJobs", "jobsInPage"),
+    ("jobs",),
+    ("searchResults", "jobs"),
+)
+_JOBS_ARRAY_POINTERS = tuple(
+    "/props/pageProps/" + "/".join(path) for path in _JOBS_ARRAY_PATHS
+)
+_JOB_TITLE_KEYS = ("title", "jobTitle")
+_JOB_URL_KEYS = ("jobUrl", "url", "absoluteUrl", "opportunityUrl")
+_SKIP_JSON_KEYS = frozenset({"runtimeConfig", "buildId", "__N_SSG"})
+
+_JOB_ANCHOR_SELECTOR = 'a[href*="/opportunities/jobs/"]'
+_COMPANY_HREF_MARKER = "/companies/"
+# Matches only a real id attribute (not data-id=, x-id=, ...) whose whole value
+# is __NEXT_DATA__, mirroring the script#__NEXT_DATA__ lookup.
+_NEXT_DATA_OPEN_RE = re.compile(
+    r"""<script\b[^>]*(?<![\w-])id\s*=\s*["']?__NEXT_DATA__(?=["'\s/>])[^>]*>""", re.IGNORECASE
+)
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_DASH_RE = re.compile(r"-+")
+_DAYS_AGO_RE = re.compile(r"(\d+)")
+
+# simdjson parsers are not thread-safe and page workers parse concurrently.
+_simdjson_local = threading.local()
+
+
 class Glints(Scraper):
     base_url = "https://glints.com"
 
@@ -34,6 +107,9 @@ class Glints(Scraper):
         user_agent: str | None = None,
     ):
         super().__init__(Site.GLINTS, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        # One tls_client session is shared by every page worker so its
+        # underlying connection pool keeps the glints.com connection alive
+        # across pages instead of re-handshaking per request.
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -44,8 +120,7 @@ class Glints(Scraper):
         self._base_headers = {
             "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
             "accept-language": "en-US,en;q=0.9,id;q=0.8",
-            "cache-control": "no-cache",
-            "pragma": "no-cache",
+            "connection": "keep-alive",
             "sec-fetch-dest": "document",
             "sec-fetch-mode": "navigate",
             "sec-fetch-site": "none",
@@ -62,51 +137,64 @@ class Glints(Scraper):
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
 
-        job_list: list[JobPost] = []
-        page = 1
-
         target = scraper_input.results_wanted + (scraper_input.offset or 0)
         max_pages = min(
             self.max_pages,
-            max(1, math.ceil(target / self.jobs_per_page) + 2),
+            max(1, (target + self.jobs_per_page - 1) // self.jobs_per_page + 2),
         )
 
-        while len(self.seen_urls) < target and page <= max_pages:
-            batch_pages = list(range(page, min(max_pages, page + self.page_max_workers - 1) + 1))
-            for p in batch_pages:
-                log.info(f"search page: {p} / {max_pages}")
-
-            try:
-                with ThreadPoolExecutor(max_workers=min(self.page_max_workers, len(batch_pages))) as executor:
-                    futures = [executor.submit(self._scrape_page, p) for p in batch_pages]
-
-                batch_jobs: list[list[JobPost]] = []
-                for fut in futures:
-                    batch_jobs.append(fut.result())
-            except Exception as e:
-                log.error(f"Glints: failed to scrape pages: {e}")
-                break
-
-            any_jobs = False
-            for jobs in batch_jobs:
-                if jobs:
-                    any_jobs = True
-                    job_list.extend(jobs)
-                if len(self.seen_urls) >= target:
+        # Pages are fetched through a sliding window: page 1 probes the
+        # result set, then up to page_max_workers pages stay in flight and a
+        # new one is dispatched as soon as any completes. The politeness
+        # jitter is slept inside each worker so it never stalls the window.
+        page_jobs: dict[int, list[JobPost]] = {}
+        last_page = max_pages
+        next_page = 1
+        in_flight: dict[Future, int] = {}
+
+        with ThreadPoolExecutor(max_workers=self.page_max_workers) as executor:
+            while True:
+                while (
+                    next_page <= last_page
+                    and len(in_flight) < (self.page_max_workers if page_jobs else 1)
+                    and len(self.seen_urls) < target
+                ):
+                    log.info(f"search page: {next_page} / {max_pages}")
+                    delay = (
+                        random.uniform(self.delay, self.delay + self.band_delay)
+                        if next_page > 1
+                        else 0.0
+                    )
+                    fut = executor.submit(self._scrape_page_after, next_page, delay)
+                    in_flight[fut] = next_page
+                    next_page += 1
+
+                if not in_flight:
                     break
 
-            if not any_jobs:
-                break
-
-            page = batch_pages[-1] + 1
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    p = in_flight.pop(fut)
+                    try:
+                        jobs = fut.result()
+                    except Exception as e:
+                        log.error(f"Glints: failed to scrape page {p}: {e}")
+                        jobs = []
+                    page_jobs[p] = jobs
+                    if not jobs:
+                        last_page = min(last_page, p - 1)
 
-            if len(self.seen_urls) < target and page <= max_pages:
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+        job_list = [job for p in sorted(page_jobs) for job in page_jobs[p]]
 
         start = scraper_input.offset or 0
         end = start + scraper_input.results_wanted
         return JobResponse(jobs=job_list[start:end])
 
+    def _scrape_page_after(self, page: int, delay: float) -> list[JobPost]:
+        if delay > 0:
+            time.sleep(delay)
+        return self._scrape_page(page)
+
     def _scrape_page(self, page: int) -> list[JobPost]:
         url = self._build_list_url(page)
         resp = self._get(url)
@@ -116,13 +204,15 @@ class Glints(Scraper):
         if status_code not in range(200, 400):
             return []
 
-        soup = BeautifulSoup(getattr(resp, "text", ""), "html.parser")
+        html = getattr(resp, "text", "") or ""
 
-        jobs = self._parse_jobs_from_next_data(soup)
-        if jobs:
-            return jobs
+        # __NEXT_DATA__ is sliced straight out of the raw HTML; the DOM is
+        # only built when we have to fall back to scraping job cards.
+        items = self._parse_jobs_from_next_data_text(_extract_next_data(html))
+        if not items:
+            items = self._parse_jobs_from_html(LexborHTMLParser(html))
 
-        return self._parse_jobs_from_html(soup)
+        return self._items_to_job_posts(items)
 
     def _get(self, url: str):
         timeout = int(getattr(self.scraper_input, "request_timeout", 60) or 60)
@@ -165,29 +255,26 @@ class Glints(Scraper):
             params.append(f"location={self.scraper_input.location}")
         return f"{self.base_url}/id/lowongan-kerja?{'&'.join(params)}"
 
-    def _parse_jobs_from_next_data(self, soup: BeautifulSoup) -> list[JobPost]:
-        script = soup.find("script", id="__NEXT_DATA__")
-        if not script or not script.string:
-            return []
-
-        try:
-            import json
+    def _parse_jobs_from_next_data_text(self, script_text: str | None) -> _ItemsSoA:
+        if not script_text:
+            return _ItemsSoA()
 
-            payload = json.loads(script.string)
-        except Exception:
-            return []
+        raw = script_text.encode("utf-8")
+        jobs_in_page = _probe_jobs_array(raw)
+        if jobs_in_page is None:
+            try:
+                payload = _json.loads(raw)
+            except Exception:
+                return _ItemsSoA()
 
-        page_props = (
-            payload.get("props", {})
-            .get("pageProps", {})
-        )
+            page_props = (
+                payload.get("props", {})
+                .get("pageProps", {})
+            )
 
-        initial_jobs = page_props.get("initialJobs")
-        jobs_in_page = None
-        if isinstance(initial_jobs, dict):
-            jobs_in_page = initial_jobs.get("jobsInPage")
+            jobs_in_page = _find_jobs_array(page_props)
 
-        items: list[dict[str, Any]] = []
+        items = _ItemsSoA()
         if isinstance(jobs_in_page, list):
             for job in jobs_in_page:
                 if not isinstance(job, dict):
@@ -208,22 +295,17 @@ class Glints(Scraper):
                 job_url = f"{self.base_url}/id/opportunities/jobs/{slug}/{job_id}"
 
                 items.append(
-                    {
-                        "title": str(title),
-                        "job_url": job_url,
-                        "company_name": str(company_name) if company_name else None,
-                        "location": str(location_str) if location_str else None,
-                        "id": job_id,
-                        "posted_at": job.get("createdAt") or job.get("updatedAt"),
-                    }
+                    str(title),
+                    job_url,
+                    str(company_name) if company_name else None,
+                    str(location_str) if location_str else None,
+                    job_id,
+                    job.get("createdAt") or job.get("updatedAt"),
                 )
 
-            return self._items_to_job_posts(items)
+            return items
 
         for obj in _walk_json(payload):
-            if not isinstance(obj, dict):
-                continue
-
             title = obj.get("title") or obj.get("jobTitle")
             url = (
                 obj.get("jobUrl")
@@ -242,95 +324,83 @@ class Glints(Scraper):
             location_str = obj.get("location") or obj.get("locationName")
 
             items.append(
-                {
-                    "title": str(title),
-                    "job_url": str(url),
-                    "company_name": str(company_name) if company_name else None,
-                    "location": str(location_str) if location_str else None,
-                    "id": obj.get("id") or obj.get("opportunityId") or obj.get("jobId"),
-                    "posted_at": obj.get("postedAt") or obj.get("postedDate") or obj.get("createdAt"),
-                }
+                str(title),
+                str(url),
+                str(company_name) if company_name else None,
+                str(location_str) if location_str else None,
+                obj.get("id") or obj.get("opportunityId") or obj.get("jobId"),
+                obj.get("postedAt") or obj.get("postedDate") or obj.get("createdAt"),
             )
 
-        return self._items_to_job_posts(items)
+        return items
 
-    def _parse_jobs_from_html(self, soup: BeautifulSoup) -> list[JobPost]:
-        anchors = soup.find_all("a", href=True)
-        items: list[dict[str, Any]] = []
-        for a in anchors:
-            href = a.get("href")
-            if not href or "/opportunities/jobs/" not in href:
+    def _parse_jobs_from_html(self, tree: LexborHTMLParser) -> _ItemsSoA:
+        items = _ItemsSoA()
+        for a in tree.css(_JOB_ANCHOR_SELECTOR):
+            href = a.attributes.get("href")
+            if not href:
                 continue
 
-            job_url = urljoin(self.base_url, href)
+            job_url = _absolute_url(self.base_url, href)
             title = None
-            h3 = a.find("h3")
-            if h3:
-                title = h3.get_text(strip=True)
+            h3 = a.css_first("h3")
+            if h3 is not None:
+                title = h3.text(strip=True)
             if not title:
-                title = a.get_text(" ", strip=True)
+                title = a.text(separator=" ", strip=True)
 
             if not title:
                 continue
 
             company_name = None
-            company_candidate = a.find("a")
-            if company_candidate:
-                company_name = company_candidate.get_text(strip=True) or None
+            company_link = _find_company_link(a, href)
+            if company_link is not None:
+                company_name = company_link.text(strip=True) or None
 
-            items.append(
-                {
-                    "title": title,
-                    "job_url": job_url,
-                    "company_name": company_name,
-                    "location": None,
-                    "id": None,
-                    "posted_at": None,
-                }
-            )
-
-        return self._items_to_job_posts(items)
+            items.append(title, job_url, company_name, None, None, None)
 
-    def _items_to_job_posts(self, items: list[dict[str, Any]]) -> list[JobPost]:
-        jobs: list[JobPost] = []
+        return items
 
-        for it in items:
-            job_url = it.get("job_url")
-            if not job_url:
-                continue
-            if not isinstance(job_url, str):
-                continue
-            if not job_url.startswith("http"):
-                job_url = urljoin(self.base_url, job_url)
+    def _items_to_job_posts(self, items: _ItemsSoA) -> list[JobPost]:
+        # Items are trusted output of our own parsers: dedupe the URL column
+        # against seen_urls in one pass, then build the models without
+        # re-running validation.
+        urls = [_absolute_url(self.base_url, u) for u in items.urls]
 
-            with self._seen_lock:
-                if job_url in self.seen_urls:
-                    continue
-                self.seen_urls.add(job_url)
+        keep: list[bool] = []
+        with self._seen_lock:
+            for job_url in urls:
+                fresh = job_url not in self.seen_urls
+                if fresh:
+                    self.seen_urls.add(job_url)
+                keep.append(fresh)
 
-            title = it.get("title")
-            if not title or not isinstance(title, str):
+        jobs: list[JobPost] = []
+        for fresh, job_url, title, company_name, location_str, job_id, posted_at in zip(
+            keep,
+            urls,
+            items.titles,
+            items.companies,
+            items.locations,
+            items.ids,
+            items.posted_ats,
+        ):
+            if not fresh:
                 continue
 
-            company_name = it.get("company_name")
-            location_str = it.get("location")
-            location = None
-            if location_str and isinstance(location_str, str):
-                location = Location(city=location_str)
+            location = Location.model_construct(city=location_str) if location_str else None
 
-            date_posted = _parse_posted_date(it.get("posted_at"))
-
-            job_id = it.get("id")
             if job_id is None:
-                job_id = f"gl-{abs(hash(job_url))}"
+                job_id = hashlib.blake2b(job_url.encode(), digest_size=8).hexdigest()
+            job_id = str(job_id)
 
             jobs.append(
-                JobPost(
-                    id=f"gl-{job_id}" if not str(job_id).startswith("gl-") else str(job_id),
+                JobPost.model_construct(
+                    id=job_id if job_id.startswith("gl-") else f"gl-{job_id}",
                     title=title,
                     company_name=company_name,
                     location=location,
-                    date_posted=date_posted,
+                    date_posted=_parse_posted_date(posted_at),
                     job_url=job_url,
                 )
             )
@@ -338,14 +408,110 @@ class Glints(Scraper):
         return jobs
 
 
-def _walk_json(obj: Any) -> Iterable[Any]:
-    if isinstance(obj, dict):
-        yield obj
-        for v in obj.values():
-            yield from _walk_json(v)
-    elif isinstance(obj, list):
-        for v in obj:
-            yield from _walk_json(v)
+def _absolute_url(base_url: str, url: str) -> str:
+    if url.startswith("http"):
+        return url
+    # Glints links are almost always root-relative ("/id/..."), which a plain
+    # concat resolves the same as urljoin; protocol-relative "//" is not.
+    if url.startswith("/") and not url.startswith("//"):
+        return base_url + url
+    return urljoin(base_url, url)
+
+
+def _extract_next_data(html: str) -> str | None:
+    m = _NEXT_DATA_OPEN_RE.search(html)
+    if m is None:
+        return None
+    end = html.find("</script>", m.end())
+    if end == -1:
+        return None
+    return html[m.end() : end]
+
+
+def _find_company_link(anchor: Any, href: str) -> Any:
+    # Lexbor does not nest anchors: a company link written inside the job
+    # anchor is moved after it, possibly wrapped next to an empty clone of the
+    # job anchor. Look inside the anchor, then through the following siblings
+    # of the card, stopping at the next card's job anchor.
+    for link in anchor.css("a[href]"):
+        if _COMPANY_HREF_MARKER in link.attributes.get("href", ""):
+            return link
+
+    sibling = anchor.next
+    while sibling is not None:
+        if not sibling.tag.startswith("-"):
+            for link in sibling.css("a[href]"):
+                link_href = link.attributes.get("href") or ""
+                if _COMPANY_HREF_MARKER in link_href:
+                    return link
+                if "/opportunities/jobs/" in link_href and link_href != href:
+                    return None
+        sibling = sibling.next
+    return None
+
+
+def _probe_jobs_array(raw: bytes) -> list[Any] | None:
+    # Jump straight to a known jobs array with simdjson and materialize it into
+    # plain Python objects; None means "fall back to a full decode". No proxy
+    # may outlive this call, or the next parse on this thread's parser fails.
+    if simdjson is None:
+        return None
+
+    parser = getattr(_simdjson_local, "parser", None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+
+    try:
+        doc = parser.parse(raw)
+    except (ValueError, RuntimeError):
+        # RuntimeError: the thread's parser is still pinned by a live proxy.
+        return None
+
+    for pointer in _JOBS_ARRAY_POINTERS:
+        try:
+            node = doc.at_pointer(pointer)
+        except (KeyError, IndexError, TypeError):
+            continue
+        if isinstance(node, simdjson.Array):
+            return node.as_list()
+    return None
+
+
+def _find_jobs_array(page_props: Any) -> list[Any] | None:
+    if not isinstance(page_props, dict):
+        return None
+    for path in _JOBS_ARRAY_PATHS:
+        node: Any = page_props
+        for key in path:
+            if not isinstance(node, dict):
+                node = None
+                break
+            node = node.get(key)
+        if isinstance(node, list):
+            return node
+    return None
+
+
+def _looks_like_job(obj: dict[str, Any]) -> bool:
+    return any(k in obj for k in _JOB_TITLE_KEYS) and any(k in obj for k in _JOB_URL_KEYS)
+
+
+def _walk_json(root: Any) -> Iterable[dict[str, Any]]:
+    # Iterative pre-order walk; children are pushed reversed so job order
+    # matches the document order of the recursive version.
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if _looks_like_job(obj):
+                yield obj
+            stack.extend(
+                v
+                for k, v in reversed(obj.items())
+                if k not in _SKIP_JSON_KEYS and isinstance(v, (dict, list))
+            )
+        elif isinstance(obj, list):
+            stack.extend(v for v in reversed(obj) if isinstance(v, (dict, list)))
 
 
 def _parse_posted_date(value: Any):
@@ -370,9 +536,7 @@ def _parse_posted_date(value: Any):
 
             v_low = v.lower()
             if "day" in v_low and "ago" in v_low:
-                import re
-
-                m = re.search(r"(\d+)", v_low)
+                m = _DAYS_AGO_RE.search(v_low)
                 if m:
                     days = int(m.group(1))
                     return (datetime.now() - timedelta(days=days)).date()
@@ -384,9 +548,5 @@ def _parse_posted_date(value: Any):
 
 
 def _slugify(text: str) -> str:
-    import re
-
-    t = text.lower().strip()
-    t = re.sub(r"[^a-z0-9]+", "-", t)
-    t = re.sub(r"-+", "-", t).strip("-")
+    t = _DASH_RE.sub("-", _SLUG_RE.sub("-", text.lower().strip())).strip("-")
     return t or "job"
@@ -3,7 +3,6 @@ from __future__ import annotations
 import uuid
 
 from fastapi import APIRouter, Depends, Header, HTTPException
-from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -34,15 +33,14 @@ async def delete_scrape_task(
     except ValueError as e:
         raise HTTPException(status_code=400, detail="Invalid task_id") from e
 
-    result = await db.execute(select(ScrapeTask).where(ScrapeTask.id == task_uuid))
-    task = result.scalar_one_or_none()
+    task = await db.get(ScrapeTask, task_uuid)
     if task is None:
-        return ScrapeDeleteResponse(task_id=task_id, deleted=False)
+        return ScrapeDeleteResponse.model_construct(task_id=task_id, deleted=False)
 
     if not force and task.status == "running":
         raise HTTPException(status_code=409, detail="Task is running")
 
-    await db.execute(delete(ScrapeTask).where(ScrapeTask.id == task_uuid))
+    await db.delete(task)
     await db.commit()
 
-    return ScrapeDeleteResponse(task_id=task_id, deleted=True)
+    return ScrapeDeleteResponse.model_construct(task_id=task_id, deleted=True)
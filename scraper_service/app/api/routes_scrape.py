@@ -22,4 +22,4 @@ async def create_scrape(req: ScrapeRequest, db: AsyncSession = Depends(get_db))
 
     await start_scrape_background(task_id=str(task.id), query=req.query, location=req.location)
 
-    return ScrapeCreateResponse(task_id=str(task.id), status="pending")
+    return ScrapeCreateResponse.model_construct(task_id=str(task.id), status="pending")
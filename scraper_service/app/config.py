@@ -1,30 +1,45 @@
-import os
+from functools import lru_cache
 
 from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 load_dotenv()
 
 
-def _int_env(name: str, default: int) -> int:
-    value = os.getenv(name)
-    if value is None or value == "":
-        return default
-    return int(value)
-
-
-class Settings:
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "")
-    MAX_RESULTS_PER_SITE: int = _int_env("MAX_RESULTS_PER_SITE", 50)
-    SCRAPE_TIMEOUT_SECONDS: int = _int_env("SCRAPE_TIMEOUT_SECONDS", 120)
-    SITES_CONCURRENCY: int = _int_env("SITES_CONCURRENCY", 3)
-    SLOW_SCRAPE_THRESHOLD_SECONDS: int = _int_env("SLOW_SCRAPE_THRESHOLD_SECONDS", 30)
-    DB_INSERT_CHUNK_SIZE: int = _int_env("DB_INSERT_CHUNK_SIZE", 500)
-
-    GO_BACKEND_URL: str = os.getenv("GO_BACKEND_URL", "")
-    INTERNAL_TOKEN: str = os.getenv("INTERNAL_TOKEN", "")
-    WEBHOOK_TIMEOUT_SECONDS: int = _int_env("WEBHOOK_TIMEOUT_SECONDS", 5)
-    WEBHOOK_MAX_RETRIES: int = _int_env("WEBHOOK_MAX_RETRIES", 5)
-
-
-settings = Settings()
+class Settings(BaseSettings):
+    # Values are read from the environment (plus .env via load_dotenv above)
+    # once; empty variables fall back to the defaults below.
+    model_config = SettingsConfigDict(frozen=True, env_ignore_empty=True)
+
+    DATABASE_URL: str = ""
+    AUTO_CREATE_SCHEMA: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 512
+    MAX_RESULTS_PER_SITE: int = 50
+    SCRAPE_TIMEOUT_SECONDS: int = 120
+    SITES_CONCURRENCY: int = 5
+    SCRAPE_WORKERS: int = 4
+    SCRAPE_QUEUE_MAXSIZE: int = 1000
+    HTTP_DURATION_HEADER: bool = False
+    SLOW_SCRAPE_THRESHOLD_SECONDS: int = 30
+    DB_INSERT_CHUNK_SIZE: int = 500
+
+    GO_BACKEND_URL: str = ""
+    INTERNAL_TOKEN: str = ""
+    WEBHOOK_TIMEOUT_SECONDS: int = 5
+    WEBHOOK_MAX_RETRIES: int = 5
+    # Upper bound on remembered (task_id, source) webhook dedupe keys, and how
+    # long a delivered key is kept before it is forgotten.
+    WEBHOOK_DEDUPE_MAX_KEYS: int = 100_000
+    WEBHOOK_DEDUPE_TTL_SECONDS: int = 3600
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
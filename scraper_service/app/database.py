@@ -7,10 +7,29 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from app.config import settings
 
 
+def _asyncpg_url(url: str) -> str:
+    for prefix in ("postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix) :]
+    return url
+
+
 def _make_engine():
     if not settings.DATABASE_URL:
         raise RuntimeError("DATABASE_URL is required")
-    return create_async_engine(settings.DATABASE_URL, pool_pre_ping=True)
+    # No pre-ping: connectivity is probed once at startup and stale
+    # connections are recycled instead of paying a SELECT 1 per checkout.
+    return create_async_engine(
+        _asyncpg_url(settings.DATABASE_URL),
+        pool_pre_ping=False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
 
 
 engine = _make_engine()
@@ -1,9 +1,53 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+from typing import Any
 
-from app.scraper_runner import run_scrape_task
+from app.config import settings
+from app.scraper_runner import run_scrape_task, shutdown_scrape_pool
+
+
+scrape_logger = logging.getLogger("app.scrape")
+
+_scrape_queue: asyncio.Queue[dict[str, Any]] | None = None
+_scrape_workers: list[asyncio.Task[None]] = []
+
+
+async def _worker(queue: asyncio.Queue[dict[str, Any]]) -> None:
+    while True:
+        task = await queue.get()
+        try:
+            await run_scrape_task(**task)
+        except Exception:
+            scrape_logger.exception(
+                "scrape worker task crashed | task_id=%s",
+                task.get("task_id"),
+            )
+        finally:
+            queue.task_done()
+
+
+def start_scrape_workers() -> tuple[asyncio.Queue[dict[str, Any]], list[asyncio.Task[None]]]:
+    global _scrape_queue
+
+    _scrape_queue = asyncio.Queue(maxsize=max(0, int(settings.SCRAPE_QUEUE_MAXSIZE)))
+    _scrape_workers[:] = [
+        asyncio.create_task(_worker(_scrape_queue))
+        for _ in range(max(1, int(settings.SCRAPE_WORKERS)))
+    ]
+    return _scrape_queue, list(_scrape_workers)
+
+
+async def stop_scrape_workers() -> None:
+    for worker in _scrape_workers:
+        worker.cancel()
+    await asyncio.gather(*_scrape_workers, return_exceptions=True)
+    _scrape_workers.clear()
+    shutdown_scrape_pool()
 
 
 async def start_scrape_background(task_id: str, query: str, location: str) -> None:
-    asyncio.create_task(run_scrape_task(task_id=task_id, query=query, location=location))
+    if _scrape_queue is None:
+        raise RuntimeError("scrape workers are not running")
+    await _scrape_queue.put({"task_id": task_id, "query": query, "location": location})
@@ -7,13 +7,17 @@ import uuid
 
 from fastapi import FastAPI
 from fastapi import Request
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from app.api.routes_internal import router as internal_router
 from app.api.routes_scrape import router as scrape_router
 from app.api.routes_status import router as status_router
+from app.config import settings
 from app.database import engine
+from app.job_manager import start_scrape_workers, stop_scrape_workers
 from app.models import Base
+from app.scraper_runner import preload_source_ids
+from app.services.webhook import close_session as close_webhook_session
 
 
 logging.basicConfig(
@@ -29,41 +33,44 @@ app = FastAPI(title="Scraper Service")
 
 @app.middleware("http")
 async def log_http_requests(request: Request, call_next):
-    start = time.perf_counter()
-
-    client_host = request.client.host if request.client else "unknown"
-    method = request.method
-    path = request.url.path
-    query = request.url.query
-    user_agent = request.headers.get("user-agent", "")
+    log_info = http_logger.isEnabledFor(logging.INFO)
+    # Only time the request when something consumes the duration.
+    start = time.perf_counter() if (log_info or settings.HTTP_DURATION_HEADER) else None
 
     try:
         response = await call_next(request)
     except Exception:
-        duration_ms = (time.perf_counter() - start) * 1000.0
+        duration = "" if start is None else f" duration_ms={(time.perf_counter() - start) * 1000.0:.2f}"
         http_logger.exception(
-            "HTTP request failed | client=%s method=%s path=%s query=%s status=%s duration_ms=%.2f user_agent=%s",
-            client_host,
-            method,
-            path,
-            query,
+            "HTTP request failed | client=%s method=%s path=%s query=%s status=%s%s user_agent=%s",
+            request.client.host if request.client else "unknown",
+            request.method,
+            request.url.path,
+            request.url.query,
             500,
-            duration_ms,
-            user_agent,
+            duration,
+            request.headers.get("user-agent", ""),
         )
         raise
 
+    if start is None:
+        return response
+
     duration_ms = (time.perf_counter() - start) * 1000.0
-    http_logger.info(
-        "HTTP request | client=%s method=%s path=%s query=%s status=%s duration_ms=%.2f user_agent=%s",
-        client_host,
-        method,
-        path,
-        query,
-        response.status_code,
-        duration_ms,
-        user_agent,
-    )
+    if settings.HTTP_DURATION_HEADER:
+        response.headers["x-request-duration-ms"] = f"{duration_ms:.2f}"
+
+    if log_info:
+        http_logger.info(
+            "HTTP request | client=%s method=%s path=%s query=%s status=%s duration_ms=%.2f user_agent=%s",
+            request.client.host if request.client else "unknown",
+            request.method,
+            request.url.path,
+            request.url.query,
+            response.status_code,
+            duration_ms,
+            request.headers.get("user-agent", ""),
+        )
     return response
 
 app.include_router(scrape_router)
@@ -74,24 +81,56 @@ app.include_router(internal_router)
 @app.on_event("startup")
 async def on_startup() -> None:
     scrape_logger.info("service startup")
+
+    seed_sources = [
+        (str(uuid.uuid4()), "indeed", "https://www.indeed.com"),
+        (str(uuid.uuid4()), "linkedin", "https://www.linkedin.com"),
+        (str(uuid.uuid4()), "glassdoor", "https://www.glassdoor.com"),
+        (str(uuid.uuid4()), "google", "https://www.google.com"),
+        (str(uuid.uuid4()), "glints", "https://glints.com"),
+    ]
+
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-        seed_sources = [
-            (str(uuid.uuid4()), "indeed", "https://www.indeed.com"),
-            (str(uuid.uuid4()), "linkedin", "https://www.linkedin.com"),
-            (str(uuid.uuid4()), "glassdoor", "https://www.glassdoor.com"),
-            (str(uuid.uuid4()), "google", "https://www.google.com"),
-            (str(uuid.uuid4()), "glints", "https://glints.com"),
-        ]
-
-        await conn.execute(
-            text(
-                """
-                INSERT INTO job_sources (id, name, base_url)
-                VALUES (:id, :name, :base_url)
-                ON CONFLICT (name) DO NOTHING;
-                """
-            ),
-            [{"id": sid, "name": name, "base_url": base_url} for (sid, name, base_url) in seed_sources],
-        )
+        await conn.execute(text("SELECT 1"))
+
+        if settings.AUTO_CREATE_SCHEMA:
+            await conn.run_sync(Base.metadata.create_all)
+
+        seeded = (
+            await conn.execute(
+                text("SELECT COUNT(*) FROM job_sources WHERE name IN :names").bindparams(
+                    bindparam("names", expanding=True)
+                ),
+                {"names": [name for (_, name, _) in seed_sources]},
+            )
+        ).scalar()
+        if seeded is None or seeded < len(seed_sources):
+            await conn.execute(
+                text(
+                    """
+                    INSERT INTO job_sources (id, name, base_url)
+                    VALUES (:id, :name, :base_url)
+                    ON CONFLICT (name) DO NOTHING;
+                    """
+                ),
+                [{"id": sid, "name": name, "base_url": base_url} for (sid, name, base_url) in seed_sources],
+            )
+
+    cached_sources = await preload_source_ids()
+    scrape_logger.info("job sources cached | sources=%s", cached_sources)
+
+    app.state.scrape_queue, app.state.scrape_workers = start_scrape_workers()
+    scrape_logger.info(
+        "scrape workers started | workers=%s queue_maxsize=%s",
+        len(app.state.scrape_workers),
+        app.state.scrape_queue.maxsize,
+    )
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await stop_scrape_workers()
+    await close_webhook_session()
+    # Pooled connections belong to this event loop; a later startup (another
+    # TestClient, an embedded restart) must open fresh ones.
+    await engine.dispose()
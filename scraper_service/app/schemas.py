@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
 
 
 ScrapeStatus = Literal["pending", "running", "completed", "failed"]
@@ -15,19 +15,31 @@ class ScrapeRequest(BaseModel):
 
 
 class ScrapeCreateResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     task_id: str
     status: ScrapeStatus
 
 
 class ScrapeStatusResponse(BaseModel):
-    task_id: str
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    # Read straight off a ScrapeTask row, whose primary key is `id`.
+    task_id: str = Field(validation_alias=AliasChoices("task_id", "id"))
     status: ScrapeStatus
     total_found: int | None = None
     error_message: Optional[str] = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
+    @field_validator("task_id", mode="before")
+    @classmethod
+    def _task_id_as_str(cls, value: Any) -> Any:
+        return value if isinstance(value, str) else str(value)
+
 
 class ScrapeDeleteResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     task_id: str
     deleted: bool
@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
 import uuid
-from datetime import datetime
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import repeat
+from typing import Any, Iterator
 
 import pandas as pd
 from jobspy import scrape_jobs
-from sqlalchemy import select, update
+from sqlalchemy import select, text, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import AsyncSessionLocal
@@ -22,63 +26,179 @@ SITES: list[str] = ["indeed", "linkedin", "glassdoor", "google", "glints"]
 
 scrape_logger = logging.getLogger("app.scrape")
 
+# job_sources rows are seeded once and never renamed, so name -> id is cached
+# for the process lifetime; a miss reloads the whole (tiny) table.
+_SOURCE_CACHE: dict[str, uuid.UUID] = {}
+_SOURCE_LOCK = asyncio.Lock()
+
+# jobspy calls block and cannot be cancelled, so they get their own pool sized
+# to the most scrapes that can legitimately run at once. A timed-out scrape
+# keeps its thread until it returns but can no longer starve the loop's
+# default executor. Created on first use and dropped on shutdown, so a later
+# startup in the same process gets a fresh pool.
+_scrape_pool: ThreadPoolExecutor | None = None
+
+# Column order of the row tuples built by _normalize_frame.
+_JOB_INSERT_COLUMNS: tuple[str, ...] = (
+    "id",
+    "source_id",
+    "title",
+    "company",
+    "location",
+    "description",
+    "posted_at",
+    "scraped_at",
+    "created_at",
+    "url",
+    "source",
+    "source_url",
+    "is_active",
+)
+
+# Canonical field -> source column names in priority order; the first
+# non-empty value wins.
+_FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "job_url": ("job_url", "JOB_URL"),
+    "title": ("title", "TITLE"),
+    "company": ("company", "company_name", "COMPANY"),
+    "location": ("location", "CITY", "LOCATION"),
+    "description": ("description", "DESCRIPTION"),
+    "posted_at": ("date_posted", "posted_at"),
+}
+_SOURCE_COLUMNS: tuple[str, ...] = tuple(
+    dict.fromkeys(name for aliases in _FIELD_ALIASES.values() for name in aliases)
+)
+
+
+def _chunked(items: list[tuple[Any, ...]], size: int) -> Iterator[list[tuple[Any, ...]]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _resolve_aliases(columns: pd.Index) -> dict[str, list[str]]:
+    present = set(columns)
+    return {field: [name for name in aliases if name in present] for field, aliases in _FIELD_ALIASES.items()}
+
+
+def _coalesce_columns(df: pd.DataFrame, names: list[str]) -> pd.Series:
+    if not names:
+        return pd.Series(None, index=df.index, dtype=object)
+    if len(names) == 1:
+        # Sole alias: no fallback to fall through to, so use the column as is.
+        return df[names[0]]
+
+    out: pd.Series | None = None
+    for name in names:
+        col = df[name]
+        if pd.api.types.is_object_dtype(col.dtype) or pd.api.types.is_string_dtype(col.dtype):
+            # Mirror `a or b` semantics: empty strings fall through to the next alias.
+            col = col.mask(col.eq(""))
+        out = col if out is None else out.combine_first(col)
+    return out
+
+
+def _gen_uuids(n: int) -> list[uuid.UUID]:
+    # One urandom draw for the whole batch instead of one syscall per uuid4().
+    buf = os.urandom(16 * n)
+    return [uuid.UUID(bytes=buf[i : i + 16], version=4) for i in range(0, 16 * n, 16)]
+
+
+def _clean_str_column(col: pd.Series) -> pd.Series:
+    # One mask per column: blank or missing cells become None, the rest stay str.
+    stripped = col.astype("string").str.strip().fillna("")
+    return stripped.astype(object).where(stripped.ne(""), None)
+
+
+def _normalize_frame(
+    df: pd.DataFrame, *, source_id: uuid.UUID, site: str, now: datetime
+) -> list[tuple[Any, ...]]:
+    aliases = _resolve_aliases(df.columns)
+
+    # Rows without a usable job_url are dropped before any other column is
+    # coalesced, parsed or copied.
+    job_url = _coalesce_columns(df, aliases.pop("job_url"))
+    keep = job_url.map(lambda v: isinstance(v, str) and v != "")
+    if not keep.any():
+        return []
+    if not keep.all():
+        df = df[keep]
+        job_url = job_url[keep]
+
+    frame = pd.DataFrame(
+        {"job_url": job_url, **{field: _coalesce_columns(df, names) for field, names in aliases.items()}},
+        index=df.index,
+    )
 
-def _chunked(items: list[dict[str, Any]], chunk_size: int) -> list[list[dict[str, Any]]]:
-    size = max(1, int(chunk_size))
-    return [items[i : i + size] for i in range(0, len(items), size)]
-
-
-def _as_optional_str(value: Any) -> str | None:
-    if value is None:
-        return None
-    if isinstance(value, str):
-        v = value.strip()
-        return v if v else None
-    if pd.isna(value):
-        return None
-    return str(value)
-
-
-def _normalize_job_record(raw: dict[str, Any], *, source_id: uuid.UUID, site: str) -> dict[str, Any] | None:
-    job_url = raw.get("job_url") or raw.get("JOB_URL")
-    if not job_url or not isinstance(job_url, str):
-        return None
+    # source_id is fixed per batch, so (source_id, url) duplicates are url
+    # duplicates; drop them here rather than have Postgres probe each one.
+    # Keeps the first row, like ON CONFLICT DO NOTHING would.
+    url = _clean_str_column(frame["job_url"])
+    unique = ~(url.duplicated() & url.notna())
+    if not unique.all():
+        frame = frame[unique]
+        url = url[unique]
+
+    # The driver needs stdlib datetimes; pandas Timestamps (naive ones in
+    # particular) are rejected when encoding timestamptz values.
+    posted = pd.to_datetime(frame["posted_at"], utc=True, errors="coerce", format="mixed")
+    posted_at = pd.Series(posted.array.to_pydatetime(), index=frame.index, dtype=object).where(
+        posted.notna(), None
+    )
 
-    posted_at = raw.get("date_posted") or raw.get("posted_at")
-    posted_dt: datetime | None = None
-    if posted_at is not None and posted_at != "":
-        try:
-            ts = pd.to_datetime(posted_at, utc=True, errors="coerce")
-            if ts is not pd.NaT and not pd.isna(ts):
-                posted_dt = ts.to_pydatetime()
-        except Exception:
-            posted_dt = None
-
-    now = datetime.utcnow()
-    return {
-        "id": uuid.uuid4(),
-        "source_id": source_id,
-        "title": _as_optional_str(raw.get("title") or raw.get("TITLE")),
-        "company": _as_optional_str(
-            raw.get("company") or raw.get("company_name") or raw.get("COMPANY")
-        ),
-        "location": _as_optional_str(
-            raw.get("location") or raw.get("CITY") or raw.get("LOCATION")
-        ),
-        "description": _as_optional_str(raw.get("description") or raw.get("DESCRIPTION")),
-        "posted_at": posted_dt,
-        "scraped_at": now,
-        "created_at": now,
-        "url": _as_optional_str(job_url),
-        "source": site,
-        "source_url": _as_optional_str(job_url),
-        "is_active": True,
+    # Rows are zipped straight from per-column lists; no intermediate frame or
+    # per-row dict is built. The order must match _JOB_INSERT_COLUMNS.
+    n = len(frame)
+    urls = url.tolist()
+    columns: dict[str, Any] = {
+        "id": _gen_uuids(n),
+        "source_id": repeat(source_id, n),
+        "title": _clean_str_column(frame["title"]).tolist(),
+        "company": _clean_str_column(frame["company"]).tolist(),
+        "location": _clean_str_column(frame["location"]).tolist(),
+        "description": _clean_str_column(frame["description"]).tolist(),
+        "posted_at": posted_at.tolist(),
+        "scraped_at": repeat(now, n),
+        "created_at": repeat(now, n),
+        "url": urls,
+        "source": repeat(site, n),
+        "source_url": urls,
+        "is_active": repeat(True, n),
     }
+    return list(zip(*(columns[name] for name in _JOB_INSERT_COLUMNS)))
+
+
+async def _copy_jobs(db: AsyncSession, rows: list[tuple[Any, ...]]) -> bool:
+    # COPY into a per-transaction staging table, then a single conflict-skipping
+    # INSERT ... SELECT. The caller owns the commit; False means no COPY support.
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    if not hasattr(driver, "copy_records_to_table"):
+        return False
+
+    # Executed through the session so the driver-level transaction is open
+    # before COPY runs on the same connection.
+    await db.execute(
+        text("CREATE TEMP TABLE IF NOT EXISTS jobs_staging (LIKE jobs INCLUDING DEFAULTS) ON COMMIT DROP")
+    )
+    await driver.copy_records_to_table(
+        "jobs_staging",
+        records=rows,
+        columns=list(_JOB_INSERT_COLUMNS),
+    )
+    columns = ", ".join(_JOB_INSERT_COLUMNS)
+    await db.execute(
+        text(
+            f"INSERT INTO jobs ({columns}) SELECT {columns} FROM jobs_staging "
+            "ON CONFLICT (source_id, url) DO NOTHING"
+        )
+    )
+    return True
 
 
 async def _scrape_one_site(site: str, query: str, location: str) -> pd.DataFrame:
     def _run() -> pd.DataFrame:
-        return scrape_jobs(
+        df = scrape_jobs(
             site_name=[site],
             search_term=query,
             location=location,
@@ -86,18 +206,48 @@ async def _scrape_one_site(site: str, query: str, location: str) -> pd.DataFrame
             verbose=0,
             linkedin_fetch_description=True,
         )
+        # Drop salary, job_type, emails, ... here in the worker thread; only the
+        # alias columns are ever read downstream.
+        return df[[c for c in _SOURCE_COLUMNS if c in df.columns]]
 
-    return await asyncio.to_thread(_run)
+    return await asyncio.get_running_loop().run_in_executor(get_scrape_pool(), _run)
 
 
-async def _get_source_id(site: str) -> uuid.UUID | None:
+def get_scrape_pool() -> ThreadPoolExecutor:
+    global _scrape_pool
+    if _scrape_pool is None:
+        _scrape_pool = ThreadPoolExecutor(
+            max_workers=max(1, int(settings.SCRAPE_WORKERS)) * max(1, int(settings.SITES_CONCURRENCY)),
+            thread_name_prefix="scrape",
+        )
+    return _scrape_pool
+
+
+def shutdown_scrape_pool() -> None:
+    global _scrape_pool
+    if _scrape_pool is not None:
+        _scrape_pool.shutdown(wait=False, cancel_futures=True)
+    _scrape_pool = None
+
+
+async def preload_source_ids() -> int:
     async with AsyncSessionLocal() as db:
-        source_row = (
-            await db.execute(select(JobSource).where(JobSource.name == site))
-        ).scalar_one_or_none()
-        if source_row is None:
-            return None
-        return source_row.id
+        rows = (await db.execute(select(JobSource.name, JobSource.id))).all()
+    for name, source_id in rows:
+        if name:
+            _SOURCE_CACHE[name] = source_id
+    return len(_SOURCE_CACHE)
+
+
+async def _get_source_id(site: str) -> uuid.UUID | None:
+    source_id = _SOURCE_CACHE.get(site)
+    if source_id is not None:
+        return source_id
+    async with _SOURCE_LOCK:
+        # Another site may have warmed the cache while we waited for the lock.
+        if site not in _SOURCE_CACHE:
+            await preload_source_ids()
+    return _SOURCE_CACHE.get(site)
 
 
 async def _scrape_site_and_store(*, task_id: str, site: str, query: str, location: str) -> int:
@@ -128,6 +278,8 @@ async def _scrape_site_and_store(*, task_id: str, site: str, query: str, locatio
             timeout=settings.SCRAPE_TIMEOUT_SECONDS,
         )
     except asyncio.TimeoutError:
+        # The worker thread cannot be interrupted; it finishes in the background
+        # and its result is discarded.
         error = f"timeout_after={settings.SCRAPE_TIMEOUT_SECONDS}s"
     except Exception as e:
         error = str(e)
@@ -155,30 +307,41 @@ async def _scrape_site_and_store(*, task_id: str, site: str, query: str, locatio
         trigger_scrape_completed_webhook(task_id=task_id, keyword=query, source=site)
         return 0
 
-    records = df.to_dict(orient="records")
-    rows: list[dict[str, Any]] = []
-    for r in records:
-        normalized = _normalize_job_record(r, source_id=source_id, site=site)
-        if normalized is not None:
-            rows.append(normalized)
+    # pandas work stays off the event loop so concurrent sites keep progressing.
+    # The default executor is free for this since jobspy runs on the scrape pool.
+    rows = await asyncio.to_thread(
+        _normalize_frame,
+        df,
+        source_id=source_id,
+        site=site,
+        now=datetime.now(timezone.utc),
+    )
 
     if rows:
-        chunk_size = int(getattr(settings, "DB_INSERT_CHUNK_SIZE", 500) or 500)
-        chunks = _chunked(rows, chunk_size)
         async with AsyncSessionLocal() as db:
-            for idx, chunk in enumerate(chunks, start=1):
-                stmt = pg_insert(Job).values(chunk)
-                stmt = stmt.on_conflict_do_nothing(index_elements=[Job.source_id, Job.url])
-                await db.execute(stmt)
-                await db.commit()
+            if await _copy_jobs(db, rows):
                 scrape_logger.info(
-                    "db insert chunk done | task_id=%s site=%s chunk=%s/%s rows=%s",
+                    "db insert copy done | task_id=%s site=%s rows=%s",
                     task_id,
                     site,
-                    idx,
-                    len(chunks),
-                    len(chunk),
+                    len(rows),
                 )
+            else:
+                chunk_size = max(1, int(getattr(settings, "DB_INSERT_CHUNK_SIZE", 500) or 500))
+                total_chunks = (len(rows) + chunk_size - 1) // chunk_size
+                for idx, chunk in enumerate(_chunked(rows, chunk_size), start=1):
+                    stmt = pg_insert(Job).values([dict(zip(_JOB_INSERT_COLUMNS, row)) for row in chunk])
+                    stmt = stmt.on_conflict_do_nothing(index_elements=[Job.source_id, Job.url])
+                    await db.execute(stmt)
+                    scrape_logger.info(
+                        "db insert chunk done | task_id=%s site=%s chunk=%s/%s rows=%s",
+                        task_id,
+                        site,
+                        idx,
+                        total_chunks,
+                        len(chunk),
+                    )
+            await db.commit()
 
     found = int(len(df))
     if duration_s >= float(settings.SLOW_SCRAPE_THRESHOLD_SECONDS):
@@ -207,83 +370,85 @@ async def _scrape_site_and_store(*, task_id: str, site: str, query: str, locatio
 async def run_scrape_task(task_id: str, query: str, location: str) -> None:
     task_uuid = uuid.UUID(task_id)
 
+    # One session for the task's serial status writes. Committing returns its
+    # connection to the pool, so nothing is held while the sites scrape; each
+    # site still inserts through its own session since they run concurrently.
     async with AsyncSessionLocal() as db:
         await db.execute(
             update(ScrapeTask)
             .where(ScrapeTask.id == task_uuid)
-            .values(status="running", updated_at=datetime.utcnow(), error_message=None)
+            .values(status="running", updated_at=datetime.now(timezone.utc), error_message=None)
         )
         await db.commit()
 
-    total_found = 0
+        total_found = 0
 
-    try:
-        sites = list(SITES)
-        scrape_logger.info(
-            "scrape task start | task_id=%s sites=%s sites_concurrency=%s timeout_s=%s slow_threshold_s=%s",
-            task_id,
-            ",".join(sites),
-            settings.SITES_CONCURRENCY,
-            settings.SCRAPE_TIMEOUT_SECONDS,
-            settings.SLOW_SCRAPE_THRESHOLD_SECONDS,
-        )
-
-        sem = asyncio.Semaphore(max(1, int(settings.SITES_CONCURRENCY)))
-
-        async def _bounded(site: str) -> int:
-            async with sem:
-                return await _scrape_site_and_store(
-                    task_id=task_id,
-                    site=site,
-                    query=query,
-                    location=location,
-                )
+        try:
+            sites = list(SITES)
+            scrape_logger.info(
+                "scrape task start | task_id=%s sites=%s sites_concurrency=%s timeout_s=%s slow_threshold_s=%s",
+                task_id,
+                ",".join(sites),
+                settings.SITES_CONCURRENCY,
+                settings.SCRAPE_TIMEOUT_SECONDS,
+                settings.SLOW_SCRAPE_THRESHOLD_SECONDS,
+            )
 
-        results = await asyncio.gather(*(_bounded(site) for site in sites), return_exceptions=True)
-        for site, res in zip(sites, results, strict=False):
-            if isinstance(res, Exception):
-                scrape_logger.error(
-                    "site scrape crashed | task_id=%s site=%s error=%s",
-                    task_id,
-                    site,
-                    str(res),
-                )
-                continue
-            total_found += int(res)
+            sem = asyncio.Semaphore(max(1, int(settings.SITES_CONCURRENCY)))
+
+            async def _bounded(site: str) -> int:
+                async with sem:
+                    return await _scrape_site_and_store(
+                        task_id=task_id,
+                        site=site,
+                        query=query,
+                        location=location,
+                    )
+
+            results = await asyncio.gather(*(_bounded(site) for site in sites), return_exceptions=True)
+            for site, res in zip(sites, results, strict=False):
+                if isinstance(res, Exception):
+                    scrape_logger.error(
+                        "site scrape crashed | task_id=%s site=%s error=%s",
+                        task_id,
+                        site,
+                        str(res),
+                    )
+                    continue
+                total_found += int(res)
 
-        async with AsyncSessionLocal() as db:
             await db.execute(
                 update(ScrapeTask)
                 .where(ScrapeTask.id == task_uuid)
                 .values(
                     status="completed",
                     total_found=total_found,
-                    updated_at=datetime.utcnow(),
+                    updated_at=datetime.now(timezone.utc),
                 )
             )
             await db.commit()
 
-        scrape_logger.info(
-            "scrape task completed | task_id=%s total_found=%s",
-            task_id,
-            total_found,
-        )
+            scrape_logger.info(
+                "scrape task completed | task_id=%s total_found=%s",
+                task_id,
+                total_found,
+            )
 
-    except Exception as e:
-        async with AsyncSessionLocal() as db:
+        except Exception as e:
+            await db.rollback()
             await db.execute(
                 update(ScrapeTask)
                 .where(ScrapeTask.id == task_uuid)
                 .values(
                     status="failed",
                     error_message=str(e),
-                    updated_at=datetime.utcnow(),
+                    updated_at=datetime.now(timezone.utc),
                 )
             )
             await db.commit()
 
-        scrape_logger.exception(
-            "scrape task failed | task_id=%s error=%s",
-            task_id,
-            str(e),
-        )
+            scrape_logger.exception(
+                "scrape task failed | task_id=%s error=%s",
+                task_id,
+                str(e),
+            )
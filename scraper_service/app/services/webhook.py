@@ -1,25 +1,72 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import threading
-import time
+import random
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-import requests
+import aiohttp
+from cachetools import TTLCache
 
 from app.config import settings
 
 
 logger = logging.getLogger(__name__)
 
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_MAX_SECONDS = 30.0
 
-_sent_webhooks_lock = threading.Lock()
-_sent_webhooks: set[str] = set()
-_in_flight_webhooks: set[str] = set()
 
+# (task_id, source) -> "inflight" | "sent". Only touched from the event loop,
+# so no lock is needed as long as no await sits between a check and a write.
+# Bounded so delivered keys do not accumulate for the life of the process.
+_webhook_state: TTLCache[tuple[str, str], str] = TTLCache(
+    maxsize=max(1, int(settings.WEBHOOK_DEDUPE_MAX_KEYS)),
+    ttl=float(settings.WEBHOOK_DEDUPE_TTL_SECONDS),
+)
 
-def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> None:
+_session: aiohttp.ClientSession | None = None
+# The loop only keeps weak references to tasks; hold them until they finish.
+_pending_webhooks: set[asyncio.Task[None]] = set()
+
+
+# Settings are frozen for the process lifetime, so the target and auth
+# headers are built once and shared by every call and retry.
+@lru_cache(maxsize=1)
+def _webhook_url() -> str:
+    return settings.GO_BACKEND_URL.rstrip("/") + "/internal/scrape-completed"
+
+
+@lru_cache(maxsize=1)
+def _webhook_headers() -> dict[str, str]:
+    return {
+        "Content-Type": "application/json",
+        "X-Internal-Token": settings.INTERNAL_TOKEN,
+    }
+
+
+def get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            headers=_webhook_headers(),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    global _session
+    if _pending_webhooks:
+        await asyncio.gather(*_pending_webhooks, return_exceptions=True)
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> None:
     if not settings.GO_BACKEND_URL:
         logger.error(
             "Webhook permanently failed | task_id=%s error=GO_BACKEND_URL is not set",
@@ -34,22 +81,15 @@ def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> No
         )
         return
 
-    dedupe_key = f"{task_id}:{source}"
+    dedupe_key = (task_id, source)
 
-    with _sent_webhooks_lock:
-        if dedupe_key in _sent_webhooks:
-            return
-        if dedupe_key in _in_flight_webhooks:
-            return
-        _in_flight_webhooks.add(dedupe_key)
+    if dedupe_key in _webhook_state:
+        return
+    _webhook_state[dedupe_key] = "inflight"
 
     completed_at = datetime.utcnow().isoformat() + "Z"
 
-    url = settings.GO_BACKEND_URL.rstrip("/") + "/internal/scrape-completed"
-    headers = {
-        "Content-Type": "application/json",
-        "X-Internal-Token": settings.INTERNAL_TOKEN,
-    }
+    url = _webhook_url()
     payload: dict[str, Any] = {
         "task_id": task_id,
         "keyword": keyword,
@@ -58,7 +98,8 @@ def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> No
     }
 
     max_retries = max(1, int(settings.WEBHOOK_MAX_RETRIES))
-    timeout_seconds = float(settings.WEBHOOK_TIMEOUT_SECONDS)
+    timeout = aiohttp.ClientTimeout(total=float(settings.WEBHOOK_TIMEOUT_SECONDS))
+    session = get_session()
 
     last_error: str | None = None
 
@@ -72,14 +113,9 @@ def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> No
         )
 
         try:
-            resp = requests.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=timeout_seconds,
-            )
-
-            status = resp.status_code
+            async with session.post(url, json=payload, timeout=timeout) as resp:
+                status = resp.status
+                body = "" if 200 <= status < 300 else (await resp.text(errors="replace"))[:500]
 
             if 200 <= status < 300:
                 logger.info(
@@ -88,25 +124,22 @@ def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> No
                     source,
                     status,
                 )
-                with _sent_webhooks_lock:
-                    _sent_webhooks.add(dedupe_key)
-                    _in_flight_webhooks.discard(dedupe_key)
+                _webhook_state[dedupe_key] = "sent"
                 return
 
             if status in (400, 401, 403):
-                last_error = f"non-retriable status={status} body={resp.text[:500]}"
+                last_error = f"non-retriable status={status} body={body}"
                 logger.error(
                     "Webhook permanently failed | task_id=%s source=%s error=%s",
                     task_id,
                     source,
                     last_error,
                 )
-                with _sent_webhooks_lock:
-                    _in_flight_webhooks.discard(dedupe_key)
+                _webhook_state.pop(dedupe_key, None)
                 return
 
             if status >= 500:
-                last_error = f"retriable status={status} body={resp.text[:500]}"
+                last_error = f"retriable status={status} body={body}"
                 logger.error(
                     "Webhook failed | task_id=%s source=%s error=%s",
                     task_id,
@@ -114,18 +147,17 @@ def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> No
                     last_error,
                 )
             else:
-                last_error = f"non-retriable status={status} body={resp.text[:500]}"
+                last_error = f"non-retriable status={status} body={body}"
                 logger.error(
                     "Webhook permanently failed | task_id=%s source=%s error=%s",
                     task_id,
                     source,
                     last_error,
                 )
-                with _sent_webhooks_lock:
-                    _in_flight_webhooks.discard(dedupe_key)
+                _webhook_state.pop(dedupe_key, None)
                 return
 
-        except (requests.Timeout, requests.ConnectionError) as e:
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
             last_error = f"{type(e).__name__}: {e}"
             logger.error(
                 "Webhook failed | task_id=%s source=%s error=%s",
@@ -133,8 +165,8 @@ def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> No
                 source,
                 last_error,
             )
-        except requests.RequestException as e:
-            last_error = f"RequestException: {e}"
+        except aiohttp.ClientError as e:
+            last_error = f"ClientError: {e}"
             logger.error(
                 "Webhook failed | task_id=%s source=%s error=%s",
                 task_id,
@@ -143,9 +175,9 @@ def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> No
             )
 
         if attempt < max_retries:
-            backoff = 2 ** (attempt - 2) if attempt >= 2 else 0
-            if backoff > 0:
-                time.sleep(backoff)
+            # Full jitter, so retries from many tasks failing together spread out.
+            backoff = random.uniform(0, min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)))
+            await asyncio.sleep(backoff)
 
     logger.error(
         "Webhook permanently failed | task_id=%s source=%s error=%s",
@@ -154,13 +186,12 @@ def send_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> No
         last_error or "exhausted retries",
     )
 
-    with _sent_webhooks_lock:
-        _in_flight_webhooks.discard(dedupe_key)
+    _webhook_state.pop(dedupe_key, None)
 
 
 def trigger_scrape_completed_webhook(task_id: str, keyword: str, source: str) -> None:
-    threading.Thread(
-        target=send_scrape_completed_webhook,
-        args=(task_id, keyword, source),
-        daemon=True,
-    ).start()
+    task = asyncio.get_running_loop().create_task(
+        send_scrape_completed_webhook(task_id, keyword, source)
+    )
+    _pending_webhooks.add(task)
+    task.add_done_callback(_pending_webhooks.discard)